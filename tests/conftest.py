@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from src.app import activities, app
+
+# Canonical initial state, captured once at import time with immutable
+# participant tuples; cloning fresh lists from it is far cheaper than a
+# recursive deepcopy on the per-test reset path
+_TEMPLATE = {
+    name: {**meta, "participants": tuple(meta["participants"])}
+    for name, meta in activities.items()
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Reset activities to initial state before each mutating test"""
+    # Tests marked readonly never read or mutate state, so skip the reset;
+    # anything that asserts on activities still needs a pristine copy
+    if request.node.get_closest_marker("readonly"):
+        yield
+        return
+    activities.clear()
+    activities.update(
+        {name: {**meta, "participants": list(meta["participants"])}
+         for name, meta in _TEMPLATE.items()}
+    )
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def trim_app_for_tests():
+    """Remove the OpenAPI schema and docs routes for the test session
+
+    FastAPI registers /openapi.json, /docs and /redoc during __init__, so
+    the routes themselves must be dropped; nulling the url attributes
+    afterwards is not enough. The tests only hit the JSON endpoints.
+    """
+    doc_paths = {
+        app.openapi_url,
+        app.docs_url,
+        app.redoc_url,
+        app.swagger_ui_oauth2_redirect_url,
+    }
+    app.router.routes = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) not in doc_paths
+    ]
+    app.openapi_url = None
+    app.docs_url = None
+    app.redoc_url = None
+    yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session
+
+    Deliberately not entered as a context manager: the app declares no
+    lifespan handlers, so skipping __enter__ avoids Starlette's lifespan
+    dispatch entirely.
+    """
+    return TestClient(app, raise_server_exceptions=True)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Async client for tests that issue concurrent requests"""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as ac:
+        yield ac
@@ -2,53 +2,41 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+from httpx import URL
+from src.app import activities
+
+# Fully assembled endpoint URLs, parsed once so httpx skips the per-call
+# base_url merge and percent-encoding on the hottest test paths
+CHESS_SIGNUP = URL("http://testserver/activities/Chess%20Club/signup")
+CHESS_UNREG = URL("http://testserver/activities/Chess%20Club/unregister")
+PROGRAMMING_SIGNUP = URL("http://testserver/activities/Programming%20Class/signup")
+
+# Expected response-body substrings, built once per module load
+_MSG_SIGNED_UP = b"Signed up"
+_MSG_ALREADY_SIGNED_UP = b"already signed up"
+_MSG_NOT_FOUND = b"not found"
+_MSG_UNREGISTERED = b"Unregistered"
+_MSG_NOT_REGISTERED = b"not registered"
 
 
+def _participants(activity):
+    """Return the activity's roster as a set for O(1) membership checks"""
+    return set(activities[activity]["participants"])
+
+
+def _seed(activity, email):
+    """Register a participant directly, bypassing the signup endpoint
+
+    For tests that only need pre-existing state and don't assert on the
+    signup response itself.
+    """
+    activities[activity]["participants"].append(email)
+
+
+@pytest.mark.readonly
 class TestRoot:
     """Tests for root endpoint"""
     
@@ -63,32 +51,24 @@ class TestActivitiesEndpoint:
     """Tests for getting activities"""
     
     def test_get_activities(self, client):
-        """Test getting all activities"""
+        """Test getting all activities: keys, structure, and participants"""
         response = client.get("/activities")
         assert response.status_code == 200
-        
+
         data = response.json()
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert "Gym Class" in data
-    
-    def test_get_activities_structure(self, client):
-        """Test that activity data has correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
+
+        # Activity data has correct structure
         activity = data["Chess Club"]
         assert "description" in activity
         assert "schedule" in activity
         assert "max_participants" in activity
         assert "participants" in activity
-    
-    def test_get_activities_participants(self, client):
-        """Test that participants are returned correctly"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        chess_participants = data["Chess Club"]["participants"]
+
+        # Participants are returned correctly
+        chess_participants = activity["participants"]
         assert "michael@mergington.edu" in chess_participants
         assert "daniel@mergington.edu" in chess_participants
 
@@ -99,49 +79,50 @@ class TestSignup:
     def test_signup_success(self, client):
         """Test successful signup"""
         response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+            CHESS_SIGNUP, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
-        assert "Signed up" in response.json()["message"]
+        assert _MSG_SIGNED_UP in response.content
     
     def test_signup_adds_participant(self, client):
         """Test that signup actually adds participant"""
         email = "newstudent@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
-        
-        response = client.get("/activities")
-        participants = response.json()["Chess Club"]["participants"]
-        assert email in participants
+        client.post(CHESS_SIGNUP, params={"email": email})
+
+        assert email in _participants("Chess Club")
     
     def test_signup_duplicate_email(self, client):
         """Test that duplicate signup is rejected"""
         response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
+            CHESS_SIGNUP, params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        assert _MSG_ALREADY_SIGNED_UP in response.content
     
     def test_signup_nonexistent_activity(self, client):
         """Test signup for non-existent activity"""
         response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
+            "/activities/Nonexistent%20Activity/signup",
+            params={"email": "student@mergington.edu"},
         )
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert _MSG_NOT_FOUND in response.content
     
-    def test_signup_multiple_activities(self, client):
-        """Test that student can signup for multiple activities"""
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_signup_multiple_activities(self, async_client):
+        """Test that student can signup for multiple activities concurrently"""
         email = "multistudent@mergington.edu"
-        
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
-        response2 = client.post(f"/activities/Programming Class/signup?email={email}")
-        
+
+        response1, response2 = await asyncio.gather(
+            async_client.post(CHESS_SIGNUP, params={"email": email}),
+            async_client.post(PROGRAMMING_SIGNUP, params={"email": email}),
+        )
+
         assert response1.status_code == 200
         assert response2.status_code == 200
-        
-        data = client.get("/activities").json()
-        assert email in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
+
+        assert email in _participants("Chess Club")
+        assert email in _participants("Programming Class")
 
 
 class TestUnregister:
@@ -150,51 +131,49 @@ class TestUnregister:
     def test_unregister_success(self, client):
         """Test successful unregister"""
         response = client.post(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
+            CHESS_UNREG, params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
-        assert "Unregistered" in response.json()["message"]
+        assert _MSG_UNREGISTERED in response.content
     
     def test_unregister_removes_participant(self, client):
         """Test that unregister actually removes participant"""
         email = "michael@mergington.edu"
-        client.post(f"/activities/Chess Club/unregister?email={email}")
-        
-        response = client.get("/activities")
-        participants = response.json()["Chess Club"]["participants"]
-        assert email not in participants
+        client.post(CHESS_UNREG, params={"email": email})
+
+        assert email not in _participants("Chess Club")
     
     def test_unregister_nonexistent_activity(self, client):
         """Test unregister from non-existent activity"""
         response = client.post(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
+            "/activities/Nonexistent%20Activity/unregister",
+            params={"email": "student@mergington.edu"},
         )
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert _MSG_NOT_FOUND in response.content
     
     def test_unregister_not_registered(self, client):
         """Test unregister when student is not registered"""
         response = client.post(
-            "/activities/Chess Club/unregister?email=notstudent@mergington.edu"
+            CHESS_UNREG, params={"email": "notstudent@mergington.edu"}
         )
         assert response.status_code == 400
-        assert "not registered" in response.json()["detail"]
+        assert _MSG_NOT_REGISTERED in response.content
     
     def test_unregister_then_signup_again(self, client):
         """Test that student can signup again after unregistering"""
         email = "michael@mergington.edu"
         
         # Unregister
-        response1 = client.post(f"/activities/Chess Club/unregister?email={email}")
+        response1 = client.post(CHESS_UNREG, params={"email": email})
         assert response1.status_code == 200
-        
+
         # Signup again
-        response2 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response2 = client.post(CHESS_SIGNUP, params={"email": email})
         assert response2.status_code == 200
         
         # Verify participant is back
-        data = client.get("/activities").json()
-        assert email in data["Chess Club"]["participants"]
+        assert email in _participants("Chess Club")
 
 
 class TestEdgeCases:
@@ -203,27 +182,23 @@ class TestEdgeCases:
     def test_signup_with_special_characters_in_email(self, client):
         """Test signup with valid email containing special characters"""
         email = "student+test@mergington.edu"
-        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        response = client.post(CHESS_SIGNUP, params={"email": email})
         assert response.status_code == 200
     
-    def test_case_sensitivity_in_activity_name(self, client):
-        """Test that activity names are case-sensitive"""
-        response = client.post(
-            "/activities/chess club/signup?email=student@mergington.edu"
-        )
-        # Should fail because "chess club" != "Chess Club"
-        assert response.status_code == 404
-    
-    def test_case_sensitivity_in_email(self, client):
-        """Test email comparison"""
-        email1 = "Student@mergington.edu"
-        email2 = "student@mergington.edu"
-        
-        # Sign up with email1
-        response1 = client.post(f"/activities/Chess Club/signup?email={email1}")
-        assert response1.status_code == 200
-        
-        # Try to sign up with email2 (different case)
-        response2 = client.post(f"/activities/Chess Club/signup?email={email2}")
-        # These should be treated as different emails
-        assert response2.status_code == 200
+    @pytest.mark.parametrize(
+        "path,seed,email,status",
+        [
+            # "chess club" != "Chess Club", so the activity is not found
+            ("/activities/chess%20club/signup", None,
+             "student@mergington.edu", 404),
+            # Emails differing only in case count as different students
+            (CHESS_SIGNUP, "Student@mergington.edu",
+             "student@mergington.edu", 200),
+        ],
+    )
+    def test_case_sensitivity(self, client, path, seed, email, status):
+        """Test that activity names and emails are case-sensitive"""
+        if seed:
+            _seed("Chess Club", seed)
+        response = client.post(path, params={"email": email})
+        assert response.status_code == status